@@ -73,11 +73,11 @@ def parse_catalog_schema_fqn(schema_fqn: str) -> Tuple[str, str]:
     if not isinstance(schema_fqn, str):
         print(f"{Print.ERROR}schema_fqn must be a string, got {type(schema_fqn).__name__}")
         raise TypeError("schema_fqn must be a string.")
-    parts = schema_fqn.split(".")
-    if len(parts) != 2:
+    catalog, dot, schema = schema_fqn.partition(".")
+    if not dot or "." in schema:
         print(f"{Print.ERROR}Expected 'catalog.schema', got: {schema_fqn!r}")
         raise ValueError(f"Expected 'catalog.schema', got: {schema_fqn!r}")
-    return parts[0], parts[1]
+    return catalog, schema
 
 def qualify_table_name(catalog: str, schema: str, table: str) -> str:
     return f"{catalog}.{schema}.{table}"
@@ -1,26 +1,179 @@
 # src/layker/utils/table_discovery.py
 from __future__ import annotations
 
-from typing import Iterable, List, Optional, Tuple, Dict, Union
+from typing import Any, Hashable, Iterable, Iterator, List, Optional, Set, Tuple, Dict, Union
+from collections import defaultdict
+from collections.abc import Mapping
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from pathlib import Path
+import hashlib
+import io
+import json
+import re
 import sys
+import threading
+import time
 
 from databricks.sdk import WorkspaceClient
+from databricks.sdk.errors import NotFound, PermissionDenied
 from pyspark.sql import SparkSession
 
 from layker.utils.printer import Print
 from layker.utils.table import (
     is_view,
-    is_fully_qualified_table_name,
     parse_catalog_schema_fqn,
     ensure_fully_qualified,
 )
 
+_COLUMN_WORKERS = 8  # default concurrent tables.get calls when materializing columns
+_EXCLUDE_RE_MAX_PREFIXES = 64  # beyond this, exclude prefixes use length-bucketed set lookups
+_BULK_MIN_TABLES = 8  # a schema needs more uncached tables than this before its columns are bulk-queried
+_BULK_CHUNK = 500     # table names per information_schema.columns IN (...) query
+
+class _TTLCache:
+    """Minimal thread-safe TTL cache; oldest entry is evicted once maxsize is reached."""
+
+    def __init__(self, *, maxsize: int, ttl: float) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: Dict[Hashable, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Any:
+        with self._lock:
+            hit = self._data.get(key)
+            if hit is None:
+                return None
+            if hit[0] < time.monotonic():
+                del self._data[key]
+                return None
+            return hit[1]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+            if len(self._data) >= self.maxsize:
+                del self._data[next(iter(self._data))]
+            self._data[key] = (time.monotonic() + self.ttl, value)
+
+    def discard(self, key: Hashable) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def discard_where(self, pred) -> None:
+        with self._lock:
+            for key in [k for k in self._data if pred(k)]:
+                del self._data[key]
+
+# UC metadata shared across TableDiscovery instances (tree() builds a fresh one per call)
+_METADATA_CACHE = _TTLCache(maxsize=10_000, ttl=300)
+
+_PRINCIPAL_ATTRS = ("client_id", "azure_client_id", "google_service_account", "username")
+
+def _cache_namespace(client: Any) -> Optional[Tuple[str, str]]:
+    """(workspace host, principal) for a client's config, or None when either is unknown."""
+    cfg = getattr(client, "config", None)
+    host = getattr(cfg, "host", None)
+    if not host:
+        return None
+    principal = next((getattr(cfg, a, None) for a in _PRINCIPAL_ATTRS if getattr(cfg, a, None)), None)
+    if principal:
+        return str(host), str(principal)
+    token = getattr(cfg, "token", None)
+    if token:
+        # PATs identify the caller; keep only a digest of the secret in cache keys
+        return str(host), "token:" + hashlib.sha256(token.encode("utf-8")).hexdigest()[:16]
+    return None
+
+class _ColsDict(dict):
+    """Leaf {column: dtype} map in a nested tree; tagged so the renderer needn't scan values."""
+    __slots__ = ()
+
+class _LazyColumns(Mapping):
+    """{fqn -> {col: dtype}} whose column maps are fetched per schema on first access (all at once on items()/values())."""
+
+    def __init__(self, td: "TableDiscovery", tables: Iterable[str]) -> None:
+        self._td = td
+        self._tables = list(tables)
+        self._known = set(self._tables)
+        self._loaded: Dict[str, Dict[str, str]] = {}
+        # "catalog.schema" -> its tables, so a miss loads the whole schema in one batch
+        self._by_schema: Dict[str, List[str]] = defaultdict(list)
+        for t in self._tables:
+            self._by_schema[t.rsplit(".", 1)[0]].append(t)
+
+    def __contains__(self, fqn: object) -> bool:
+        return fqn in self._known
+
+    def __getitem__(self, fqn: str) -> Dict[str, str]:
+        if fqn not in self._loaded:
+            if fqn not in self._known:
+                raise KeyError(fqn)
+            self._load([t for t in self._by_schema[fqn.rsplit(".", 1)[0]] if t not in self._loaded])
+        return self._loaded[fqn]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._tables)
+
+    def __len__(self) -> int:
+        return len(self._tables)
+
+    def items(self):
+        self._load([t for t in self._tables if t not in self._loaded])
+        return super().items()
+
+    def values(self):
+        self._load([t for t in self._tables if t not in self._loaded])
+        return super().values()
+
+    def _load(self, missing: List[str]) -> None:
+        if missing:
+            self._loaded.update(self._td._materialize_columns(missing))
+
+    def __repr__(self) -> str:
+        return f"<lazy columns: {len(self._loaded)}/{len(self._tables)} tables loaded>"
+
+_FQN_RE = re.compile(r"([^.]+)\.([^.]+)\.([^.]+)")
+
+def _parse_fqn(name: str) -> Optional[Tuple[str, str, str]]:
+    """(catalog, schema, table) for a 'catalog.schema.table' name, else None."""
+    if not isinstance(name, str):
+        return None
+    m = _FQN_RE.fullmatch(name)
+    return m.groups() if m else None  # type: ignore[return-value]
+
+def _name_key(kv: Tuple[str, object]) -> str:
+    return kv[0].lower()
+
+_UC_API_PATHS: Dict[type, Tuple[Tuple[str, ...], ...]] = {}
+
+def _uc_api_paths(client: Any, *, reprobe: bool = False) -> Tuple[Tuple[str, ...], ...]:
+    """
+    Attribute paths to the tables/schemas/catalogs APIs, probed on the first client of each class.
+    reprobe=True re-derives them for this client (instances of one class may differ).
+    """
+    cls = type(client)
+    paths = None if reprobe else _UC_API_PATHS.get(cls)
+    if paths is None:
+        paths = tuple(
+            (api,) if getattr(client, api, None) is not None else ("unity_catalog", api)
+            for api in ("tables", "schemas", "catalogs")
+        )
+        _UC_API_PATHS[cls] = paths
+    return paths
+
+def _follow(obj: Any, path: Tuple[str, ...]) -> Any:
+    for attr in path:
+        obj = getattr(obj, attr, None)
+    return obj
+
 class TableDiscovery:
     """
     UC discovery with optional column materialization and optional ASCII tree rendering.
     - Primary API: discover_* methods (return lists/dicts)
     - Optional: tree(...) → print/save ASCII, or return structured data when construct_tree=False
+    - Existence probes, schema names and column maps are cached per workspace and principal for 5 minutes
+      (refresh=True or invalidate*() to bypass)
 
     source rules (inferred):
       • "catalog"                  → catalog walk
@@ -40,19 +193,56 @@ class TableDiscovery:
         exclude_prefixes: Optional[Iterable[str]] = None,  # list of prefixes; case-insensitive
         exclude_prefix: Optional[str] = None,              # single shorthand; case-insensitive
         spark: Optional[SparkSession] = None,
+        max_workers: Optional[int] = None,                # schema-listing fan-out; default min(32, #schemas)
+        column_workers: int = _COLUMN_WORKERS,            # concurrent tables.get calls for list_columns
+        cache_path: Optional[Union[str, Path]] = None,    # dir for JSON discovery results (warm starts)
+        cache_ttl: float = 600,                           # seconds a cached result stays fresh
+        use_information_schema: Optional[bool] = None,    # default: only when no sdk_client is passed
     ) -> None:
         self.w = sdk_client or WorkspaceClient()
+        # system.information_schema answers as the Spark session's identity; only a shortcut
+        # when that is the same principal as the SDK client (i.e. the ambient default client)
+        self.use_information_schema = (
+            sdk_client is None if use_information_schema is None else use_information_schema
+        )
         self.spark = spark or SparkSession.getActiveSession() or SparkSession.builder.getOrCreate()
         self.include_views = include_views
+        self.max_workers = max_workers
+        self.column_workers = max(1, column_workers)
+        self.cache_path = Path(cache_path) if cache_path else None
+        self.cache_ttl = cache_ttl
+        # metadata cache namespace: one per workspace + principal, so fresh clients for the same
+        # identity share entries but one principal never sees another's existence probes/columns;
+        # clients whose principal can't be derived only share with themselves
+        self._cache_ns = _cache_namespace(self.w) or id(self.w)
+        self._skipped: List[str] = []  # schemas whose listing failed and was skipped (list.append is thread-safe)
         self.exclude_prefixes = [p.lower() for p in (exclude_prefixes or [])]
         self.exclude_prefix_single = (exclude_prefix or "").lower().strip()
-
-        # tolerate SDK surface differences
-        self._tables   = getattr(self.w, "tables",  None) or getattr(getattr(self.w, "unity_catalog", None), "tables",  None)
-        self._schemas  = getattr(self.w, "schemas", None) or getattr(getattr(self.w, "unity_catalog", None), "schemas", None)
-        self._catalogs = getattr(self.w, "catalogs",None) or getattr(getattr(self.w, "unity_catalog", None), "catalogs",None)
+        # excludes: one compiled alternation (matched in C); very long policy lists
+        # fall back to length buckets → one set lookup per distinct prefix length
+        all_prefixes = self.exclude_prefixes + ([self.exclude_prefix_single] if self.exclude_prefix_single else [])
+        self._exclude_re: Optional[re.Pattern] = None
+        self._excl_buckets: Dict[int, Set[str]] = defaultdict(set)
+        if 0 < len(all_prefixes) <= _EXCLUDE_RE_MAX_PREFIXES:
+            self._exclude_re = re.compile("(?:" + "|".join(map(re.escape, all_prefixes)) + ")", re.IGNORECASE)
+        else:
+            for p in all_prefixes:
+                self._excl_buckets[len(p)].add(p)
+
+        # tolerate SDK surface differences (resolved once per client class)
+        self._tables, self._schemas, self._catalogs = (
+            _follow(self.w, path) for path in _uc_api_paths(self.w)
+        )
+        if self._tables is None or self._schemas is None:
+            # cached layout came from a differently shaped instance of this class
+            self._tables, self._schemas, self._catalogs = (
+                _follow(self.w, path) for path in _uc_api_paths(self.w, reprobe=True)
+            )
         if not self._tables or not self._schemas:
             raise RuntimeError("WorkspaceClient missing UC tables/schemas API.")
+        # point lookups (older SDKs lack .get → fall back to list() scans)
+        self._catalogs_get = getattr(self._catalogs, "get", None)
+        self._schemas_get  = getattr(self._schemas, "get", None)
 
     # -----------------------------------
     # One-liner (single entry point)
@@ -74,12 +264,23 @@ class TableDiscovery:
         spacious: bool = True,
         spark: Optional[SparkSession] = None,
         sdk_client: Optional[WorkspaceClient] = None,
+        max_workers: Optional[int] = None,
+        column_workers: int = _COLUMN_WORKERS,
+        cache_path: Optional[Union[str, Path]] = None,
+        cache_ttl: float = 600,
+        refresh: bool = False,
+        use_information_schema: Optional[bool] = None,
     ):
         """
         If construct_tree=True → prints ASCII and (optionally) saves to disk/DBFS; returns (ascii, saved_path|None).
         If construct_tree=False → returns (structured_payload, None):
            - list_columns=False: List[str] tables
            - list_columns=True : Dict[str, Dict[col->dtype]]
+             (catalog sources return a lazy Mapping; columns are fetched on first access)
+        cache_path → catalog/schema/pipeline results are stored there as JSON and reused for cache_ttl seconds.
+        refresh=True bypasses cached UC metadata (memory and disk) for the requested source.
+        use_information_schema → list via system.information_schema (Spark identity); defaults
+        to True only when sdk_client is None.
         """
         td = cls(
             sdk_client=sdk_client,
@@ -87,19 +288,27 @@ class TableDiscovery:
             exclude_prefixes=exclude_prefixes,
             exclude_prefix=exclude_prefix,
             spark=spark,
+            max_workers=max_workers,
+            column_workers=column_workers,
+            cache_path=cache_path,
+            cache_ttl=cache_ttl,
+            use_information_schema=use_information_schema,
         )
 
-        root_label, nested, payload = td._build_from_source(
+        payload = td._payload_from_source(
             source,
             is_pipeline=is_pipeline,
             list_columns=list_columns,
             assume_schema=assume_schema,
+            refresh=refresh,
+            lazy_columns=not construct_tree,
         )
 
         if not construct_tree:
             return payload, None
 
-        text = td._render_ascii(root_label, nested, spacious=spacious)
+        nested = td._nested_from_payload(source, payload, is_pipeline=is_pipeline, list_columns=list_columns)
+        text = td._render_ascii(source, nested, spacious=spacious)
         print(text)
         saved: Optional[Path] = None
         if save_tree:
@@ -111,44 +320,93 @@ class TableDiscovery:
     # -----------------------------------
     # Public: discovery (primary API)
     # -----------------------------------
-    def discover_catalog_tables(self, catalog: str, *, list_columns: bool = False):
+    def discover_catalog_tables(self, catalog: str, *, list_columns: bool = False, refresh: bool = False):
+        return self._disk_cached(
+            ("catalog", catalog, list_columns), refresh,
+            lambda: self._discover_catalog_tables(catalog, list_columns=list_columns, refresh=refresh),
+        )
+
+    def discover_schema_tables(self, schema_fqn: str, *, list_columns: bool = False, refresh: bool = False):
+        return self._disk_cached(
+            ("schema", schema_fqn, list_columns), refresh,
+            lambda: self._discover_schema_tables(schema_fqn, list_columns=list_columns, refresh=refresh),
+        )
+
+    def discover_pipeline_tables(
+        self,
+        pipeline_name: str,
+        *,
+        list_columns: bool = False,
+        assume_schema: Optional[str] = None,
+        page_size: int = 250,
+        empty_page_tolerance: int = 2,
+        refresh: bool = False,
+    ):
+        return self._disk_cached(
+            ("pipeline", pipeline_name, list_columns, assume_schema, page_size, empty_page_tolerance), refresh,
+            lambda: self._discover_pipeline_tables(
+                pipeline_name,
+                list_columns=list_columns,
+                assume_schema=assume_schema,
+                page_size=page_size,
+                empty_page_tolerance=empty_page_tolerance,
+                refresh=refresh,
+            ),
+        )
+
+    def _discover_catalog_tables(self, catalog: str, *, list_columns: bool, refresh: bool):
+        if refresh:
+            self.invalidate_catalog(catalog)
         self._assert_catalog_exists(catalog)
         schemas = self._list_schema_names(catalog)
         if not schemas:
             print(f"{Print.INFO}Catalog '{catalog}' has no visible schemas.")
             return {} if list_columns else []
-        all_tables: List[str] = []
-        for sch in schemas:
-            try:
-                all_tables.extend(self._list_tables_for_schema(catalog, sch))
-            except Exception as e:
-                if self._is_perm_error(str(e)):
-                    print(f"{Print.WARN}Skipping {catalog}.{sch} (permission): {e}")
-                    continue
-                print(f"{Print.WARN}Skipping {catalog}.{sch}: {e}")
-        all_tables = sorted(set(all_tables))
+        # one information_schema query for the whole catalog (when enabled). It never covers
+        # hive_metastore, so every schema without rows there is listed through the SDK client.
+        by_schema = (
+            self._list_tables_via_info_schema(catalog, schemas)
+            if self.use_information_schema and catalog.lower() != "hive_metastore"
+            else {}
+        )
+        all_tables = [t for found in by_schema.values() for t in found]
+        unlisted = [sch for sch in schemas if sch.lower() not in by_schema]
+        if unlisted:
+            # one listing round-trip per schema; overlap them
+            workers = self.max_workers or min(32, len(unlisted))
+            with ThreadPoolExecutor(max_workers=workers) as ex:
+                futures = [ex.submit(self._list_tables_for_schema_or_skip, catalog, sch) for sch in unlisted]
+                for f in as_completed(futures):
+                    all_tables.extend(f.result())
+        all_tables.sort()  # FQNs embed the schema and each schema is listed once → already unique
         if not all_tables:
             print(f"{Print.INFO}No tables found under catalog {catalog} (include_views={self.include_views}).")
             return {} if list_columns else []
         return self._materialize_columns(all_tables) if list_columns else all_tables
 
-    def discover_schema_tables(self, schema_fqn: str, *, list_columns: bool = False):
+    def _discover_schema_tables(self, schema_fqn: str, *, list_columns: bool, refresh: bool):
         catalog, schema = parse_catalog_schema_fqn(schema_fqn)
+        if refresh:
+            self.invalidate_schema(catalog, schema)
         self._assert_schema_exists(catalog, schema)
-        fqdns = self._list_tables_for_schema(catalog, schema)
-        if not fqdns:
+        if list_columns:
+            # feed the listing straight into column fetches so pagination overlaps the lookups
+            found = self._materialize_columns(self._iter_tables_for_schema(catalog, schema))
+        else:
+            found = self._list_tables_for_schema(catalog, schema)
+        if not found:
             print(f"{Print.INFO}No tables found under schema {catalog}.{schema} (include_views={self.include_views}).")
-            return {} if list_columns else []
-        return self._materialize_columns(fqdns) if list_columns else fqdns
+        return found
 
-    def discover_pipeline_tables(
+    def _discover_pipeline_tables(
         self,
         pipeline_name: str,
         *,
-        list_columns: bool = False,
-        assume_schema: Optional[str] = None,
-        page_size: int = 250,
-        empty_page_tolerance: int = 2,
+        list_columns: bool,
+        assume_schema: Optional[str],
+        page_size: int,
+        empty_page_tolerance: int,
+        refresh: bool,
     ):
         # pipelines list
         try:
@@ -175,258 +433,384 @@ class TableDiscovery:
                 raise RuntimeError(f"Permission error listing events for pipeline '{pipeline_name}': {e}") from e
             raise
 
-        names, empty = set(), 0
-        it = iter(events)
-        while True:
-            page = []
-            try:
-                for _ in range(page_size): page.append(next(it))
-            except StopIteration:
-                pass
-            page_names = {
-                getattr(ev.origin, "flow_name", None)
-                for ev in page
-                if getattr(ev.origin, "update_id", None) == latest_update and getattr(ev.origin, "flow_name", None)
-            }
-            page_names.discard(None)
-            if page_names:
-                names |= page_names
-                empty = 0
-            else:
-                empty += 1
-            if empty >= empty_page_tolerance or not page:
-                break
+        # stream events; every page_size events count as a page, stop after N pages with no matches
+        names: Set[str] = set()
+        empty = seen = 0
+        page_hit = False
+        for ev in events:
+            seen += 1
+            o = getattr(ev, "origin", None)
+            if o is not None and getattr(o, "update_id", None) == latest_update:
+                fn = getattr(o, "flow_name", None)
+                if fn:
+                    names.add(fn)
+                    page_hit = True
+            if seen == page_size:
+                empty = 0 if page_hit else empty + 1
+                if empty >= empty_page_tolerance:
+                    break
+                seen, page_hit = 0, False
 
         if not names:
             print(f"{Print.INFO}No output tables found for pipeline '{pipeline_name}' via event logs.")
             return {} if list_columns else []
 
-        # qualify bare names if possible
+        # one pass: qualify bare names if possible, apply excludes, collect column-resolvable FQNs
         out: List[str] = []
+        resolvable: List[str] = []
         for n in sorted(names):
-            if is_fully_qualified_table_name(n):
-                out.append(n)
-            elif assume_schema:
+            parsed = _parse_fqn(n)
+            if parsed is None and assume_schema:
                 try:
-                    out.append(ensure_fully_qualified(n, default_schema_fqn=assume_schema))
+                    n = ensure_fully_qualified(n, default_schema_fqn=assume_schema)
+                    parsed = _parse_fqn(n)
                 except Exception as e:
                     print(f"{Print.WARN}Could not qualify '{n}' with {assume_schema}: {e}")
-                    out.append(n)
-            else:
-                out.append(n)
-
-        # excludes
-        out = [t for t in out if self._keep_table_name(t.split(".")[-1])]
+            if not self._keep_table_name(parsed[2] if parsed else n.rsplit(".", 1)[-1]):
+                continue
+            out.append(n)
+            if parsed is not None:
+                resolvable.append(n)
 
         if not list_columns:
             if not out:
                 print(f"{Print.INFO}No tables remained after applying excludes for pipeline '{pipeline_name}'.")
             return out
 
-        resolvable = [t for t in out if is_fully_qualified_table_name(t)]
-        cols = {t: self._columns_for_table(t) for t in resolvable}
+        if refresh:
+            for t in resolvable:
+                self.invalidate(t)
+        cols = self._materialize_columns(resolvable)
         return {t: cols.get(t, {}) for t in out}
 
-    def discover_tables(self, tables: Iterable[str], *, list_columns: bool = False):
+    def discover_tables(self, tables: Iterable[str], *, list_columns: bool = False, refresh: bool = False):
         """Accept explicit identifiers; keep only FQNs and apply excludes."""
-        fqdns = [
-            t for t in tables
-            if is_fully_qualified_table_name(t) and self._keep_table_name(t.split(".")[-1])
-        ]
+        fqdns: List[str] = []
+        for t in tables:
+            parsed = _parse_fqn(t)
+            if parsed is not None and self._keep_table_name(parsed[2]):
+                fqdns.append(t)
         if not fqdns:
             print(f"{Print.INFO}No resolvable fully-qualified tables were provided.")
-        return fqdns if not list_columns else {t: self._columns_for_table(t) for t in fqdns}
+        if refresh:
+            for t in fqdns:
+                self.invalidate(t)
+        return fqdns if not list_columns else self._materialize_columns(fqdns)
+
+    # -----------------------------------
+    # Public: metadata cache
+    # -----------------------------------
+    def invalidate(self, fqn: str) -> None:
+        """Drop cached columns for one table."""
+        _METADATA_CACHE.discard(self._cache_key("columns", fqn))
+
+    def invalidate_schema(self, catalog: str, schema: str) -> None:
+        """Drop cached existence + columns for a schema and its tables."""
+        prefix = f"{catalog}.{schema}."
+        _METADATA_CACHE.discard_where(
+            lambda k: k[0] == self._cache_ns and (
+                k[1:] == ("schema", catalog, schema) or (k[1] == "columns" and k[2].startswith(prefix))
+            )
+        )
+
+    def invalidate_catalog(self, catalog: str) -> None:
+        """Drop every cached entry under a catalog."""
+        prefix = f"{catalog}."
+        _METADATA_CACHE.discard_where(
+            lambda k: k[0] == self._cache_ns and (k[2] == catalog or k[2].startswith(prefix))
+        )
+
+    def _cache_key(self, kind: str, *name: str) -> Tuple:
+        return (self._cache_ns, kind) + name
+
+    def _disk_cached(self, key: Tuple, refresh: bool, compute):
+        """
+        Reuse a JSON result under cache_path if younger than cache_ttl; else compute and store it.
+        JSON, not pickle: cache_path is often a shared DBFS/Volumes dir, and results are plain
+        lists/dicts of strings. Disabled when the client has no stable workspace key; empty
+        results, results with an unresolved (empty) column map, and results from listings
+        skipped on errors are never stored.
+        """
+        if self.cache_path is None or not isinstance(self._cache_ns, tuple):
+            return compute()
+        full_key = (
+            self._cache_ns, self.include_views, self.use_information_schema,
+            tuple(sorted(self.exclude_prefixes)), self.exclude_prefix_single,
+        ) + key
+        f = self.cache_path / f"{hashlib.sha1(repr(full_key).encode('utf-8')).hexdigest()}.json"
+        if not refresh:
+            try:
+                if time.time() - f.stat().st_mtime < self.cache_ttl:
+                    with f.open("r", encoding="utf-8") as fh:
+                        cached = json.load(fh)
+                    if isinstance(cached, (list, dict)):
+                        return cached
+            except Exception:
+                pass  # unreadable or malformed file → recompute
+        skipped = len(self._skipped)
+        value = compute()
+        if not value or len(self._skipped) != skipped:
+            return value
+        if isinstance(value, dict) and not all(value.values()):
+            return value  # some table's columns could not be resolved; retry next time
+        try:
+            f.parent.mkdir(parents=True, exist_ok=True)
+            tmp = f.with_suffix(".tmp")
+            with tmp.open("w", encoding="utf-8") as fh:
+                json.dump(value, fh)
+            tmp.replace(f)
+        except OSError as e:
+            print(f"{Print.WARN}Could not write discovery cache {f}: {e}")
+        return value
 
     # -----------------------------------
     # Internals: source → nested + payload (unified walker)
     # -----------------------------------
-    def _build_from_source(
+    def _payload_from_source(
         self,
         source: str,
         *,
         is_pipeline: bool,
         list_columns: bool,
         assume_schema: Optional[str],
-    ) -> Tuple[str, Dict[str, Dict[str, Union[Dict[str, str], str]]], Union[List[str], Dict[str, Dict[str, str]]]]:
+        refresh: bool = False,
+        lazy_columns: bool = False,
+    ) -> Union[List[str], Mapping[str, Dict[str, str]]]:
         """
-        Returns (root_label, nested_dict_for_tree, payload_for_non_tree).
-        Nested dict shape is uniform: { schema -> { table -> {} or {col:dtype} } }
-        For unresolved pipeline names, group under "<unqualified>".
+        Returns the structured payload: List[str] tables, or {table -> {col: dtype}} when list_columns.
+        lazy_columns=True defers catalog-wide column fetches until the mapping is read.
         """
         if is_pipeline:
             if "." in source:
                 raise ValueError("Pipeline names must not contain '.' when is_pipeline=True.")
-            payload = self.discover_pipeline_tables(
-                source, list_columns=list_columns, assume_schema=assume_schema
+            return self.discover_pipeline_tables(
+                source, list_columns=list_columns, assume_schema=assume_schema, refresh=refresh
             )
-            # payload can be list[str] or dict[str, dict]
-            if list_columns:
-                grouped: Dict[str, Dict[str, Dict[str, str]]] = {}
-                for name, cmap in payload.items():  # type: ignore[assignment]
-                    if is_fully_qualified_table_name(name):
-                        _, schema, table = name.split(".")
-                        grouped.setdefault(schema, {})[table] = dict(sorted(cmap.items()))
-                    else:
-                        grouped.setdefault("<unqualified>", {})[name] = dict(sorted(cmap.items()))
-                nested = {s: dict(sorted(grouped[s].items())) for s in sorted(grouped)}
-                return source, nested, payload
-            else:
-                grouped: Dict[str, Dict[str, Dict[str, str]]] = {}
-                for name in payload:  # type: ignore[assignment]
-                    if is_fully_qualified_table_name(name):
-                        _, schema, table = name.split(".")
-                        grouped.setdefault(schema, {})[table] = {}
-                    else:
-                        grouped.setdefault("<unqualified>", {})[name] = {}
-                nested = {s: dict(sorted(grouped[s].items())) for s in sorted(grouped)}
-                return source, nested, payload
 
         # not pipeline: infer from dot count
         dots = source.count(".")
         if dots == 2:  # table
-            if not is_fully_qualified_table_name(source):
+            if _parse_fqn(source) is None:
                 raise ValueError("Expected fully-qualified 'catalog.schema.table'.")
-            _, schema, table = source.split(".")
             if list_columns:
-                cmap = self._columns_for_table(source)
-                nested = {schema: {table: dict(sorted(cmap.items()))}}
-                return source, nested, {source: cmap}
-            else:
-                nested = {schema: {table: {}}}
-                return source, nested, [source]
+                if refresh:
+                    self.invalidate(source)
+                return {source: self._columns_for_table(source)}
+            return [source]
 
         if dots == 1:  # schema
-            if list_columns:
-                cols = self.discover_schema_tables(source, list_columns=True)
-                _, schema = source.split(".", 1)
-                nested = {schema: {}}
-                for fqn, cmap in cols.items():
-                    table = fqn.split(".")[2]
-                    nested[schema][table] = dict(sorted(cmap.items()))
-                nested[schema] = dict(sorted(nested[schema].items()))
-                return source, nested, cols
-            else:
-                tabs = self.discover_schema_tables(source, list_columns=False)
-                _, schema = source.split(".", 1)
-                nested = {schema: {}}
-                for fqn in tabs:
-                    nested[schema][fqn.split(".")[2]] = {}
-                nested[schema] = dict(sorted(nested[schema].items()))
-                return source, nested, tabs
+            return self.discover_schema_tables(source, list_columns=list_columns, refresh=refresh)
 
         if dots == 0:  # catalog
-            if list_columns:
-                cols = self.discover_catalog_tables(source, list_columns=True)
-                out: Dict[str, Dict] = {}
-                for fqn, cmap in cols.items():
-                    _, schema, table = fqn.split(".")
-                    out.setdefault(schema, {})[table] = dict(sorted(cmap.items()))
-                nested = {s: dict(sorted(out[s].items())) for s in sorted(out)}
-                return source, nested, cols
-            else:
-                tabs = self.discover_catalog_tables(source, list_columns=False)
-                out: Dict[str, Dict] = {}
-                for fqn in tabs:
-                    _, schema, table = fqn.split(".")
-                    out.setdefault(schema, {})[table] = {}
-                nested = {s: dict(sorted(out[s].items())) for s in sorted(out)}
-                return source, nested, tabs
+            if list_columns and lazy_columns and self.cache_path is None:
+                tabs = self.discover_catalog_tables(source, list_columns=False, refresh=refresh)
+                return _LazyColumns(self, tabs)
+            return self.discover_catalog_tables(source, list_columns=list_columns, refresh=refresh)
 
         raise ValueError("Invalid source. Use catalog | catalog.schema | catalog.schema.table, or set is_pipeline=True.")
 
+    def _nested_from_payload(
+        self,
+        source: str,
+        payload: Union[List[str], Mapping[str, Dict[str, str]]],
+        *,
+        is_pipeline: bool,
+        list_columns: bool,
+    ) -> Dict[str, Dict[str, Union[Dict[str, str], str]]]:
+        """
+        Nested dict shape is uniform: { schema -> { table -> {} or {col:dtype} } }
+        For unresolved pipeline names, group under "<unqualified>".
+        Every level is inserted in case-insensitive name order; the renderer relies on it.
+        """
+        nested: Dict[str, Dict] = {}
+        if not is_pipeline and source.count(".") == 1:
+            nested[source.split(".", 1)[1]] = {}  # schema node is shown even when empty
+        # parse each name once into a sortable row, then insert in render order (no post-sort rebuild)
+        rows: List[Tuple[str, str, str, str, str]] = []
+        for name in payload:
+            parsed = _parse_fqn(name)
+            schema, table = (parsed[1], parsed[2]) if parsed is not None else ("<unqualified>", name)
+            rows.append((schema.lower(), table.lower(), schema, table, name))
+        rows.sort(key=lambda r: (r[0], r[1]))
+        for _, _, schema, table, name in rows:
+            nested.setdefault(schema, {})[table] = _ColsDict(sorted(payload[name].items(), key=_name_key)) if list_columns else {}
+        return nested
+
     # -----------------------------------
     # Internals: render ASCII
     # -----------------------------------
     def _render_ascii(self, root_label: str, nested: Dict, *, spacious: bool) -> str:
-        lines: List[str] = [f"{root_label}/"]
-
-        def walk(node: Dict, prefix: str = ""):
-            items = sorted(node.items(), key=lambda kv: kv[0].lower())
-            for i, (name, child) in enumerate(items):
-                is_last = i == len(items) - 1
-                branch = "└── " if is_last else "├── "
-                is_leaf_cols = isinstance(child, dict) and all(isinstance(v, str) for v in child.values())
-                label = f"{name}/" if not is_leaf_cols else name
-                lines.append(prefix + branch + label)
-                next_prefix = prefix + ("    " if is_last else "│   ")
-                if isinstance(child, dict):
-                    if is_leaf_cols:
-                        cols = sorted(child.items(), key=lambda kv: kv[0].lower())
-                        for j, (cname, dtype) in enumerate(cols):
-                            c_last = j == len(cols) - 1
-                            c_branch = "└── " if c_last else "├── "
-                            lines.append(next_prefix + c_branch + f"{cname} : {dtype}")
-                        if spacious and not is_last:
-                            lines.append(prefix + "│")
-                    else:
-                        walk(child, next_prefix)
-                        if spacious and not is_last:
-                            lines.append(prefix + "│")
-
-        walk(nested)
-        return "\n".join(lines) + "\n"
+        """
+        Renders into one buffer and returns the text.
+        `nested` is walked in insertion order (_nested_from_payload pre-sorts every level).
+        """
+        buf = io.StringIO()
+        write = buf.write
+        write(f"{root_label}/\n")
+
+        # explicit stack of frames: (enumerated children, last index, prefix, spacer emitted once drained)
+        stack: List[Tuple[Iterator[Tuple[int, Tuple[str, object]]], int, str, str]] = [
+            (enumerate(nested.items()), len(nested) - 1, "", "")
+        ]
+        pop, push = stack.pop, stack.append
+        while stack:
+            items, last, prefix, trailer = stack[-1]
+            step = next(items, None)
+            if step is None:
+                pop()
+                if trailer:
+                    write(trailer)
+                continue
+            i, (name, child) = step
+            is_last = i == last
+            branch = "└── " if is_last else "├── "
+            # column maps are tagged at build time; empty dicts (no columns / no tables) render as leaves too
+            is_leaf_cols = isinstance(child, _ColsDict) or (isinstance(child, dict) and not child)
+            label = f"{name}/" if not is_leaf_cols else name
+            write(prefix + branch + label + "\n")
+            if not isinstance(child, dict):
+                continue
+            next_prefix = prefix + ("    " if is_last else "│   ")
+            spacer = prefix + "│\n" if spacious and not is_last else ""
+            if is_leaf_cols:
+                c_last = len(child) - 1
+                for j, (cname, dtype) in enumerate(child.items()):
+                    c_branch = "└── " if j == c_last else "├── "
+                    write(next_prefix + c_branch + f"{cname} : {dtype}\n")
+                if spacer:
+                    write(spacer)
+            else:
+                push((enumerate(child.items()), len(child) - 1, next_prefix, spacer))
+
+        return buf.getvalue()
 
     # -----------------------------------
     # Internals: listing + columns
     # -----------------------------------
     def _assert_catalog_exists(self, catalog: str) -> None:
+        key = self._cache_key("catalog", catalog)
+        if _METADATA_CACHE.get(key):
+            return
         try:
-            if self._catalogs is not None:
+            if self._catalogs_get is not None:
+                try:
+                    self._catalogs_get(name=catalog)
+                except NotFound:
+                    raise RuntimeError(f"Catalog not found: {catalog}")
+            elif self._catalogs is not None:
                 if not any(c.name == catalog for c in self._catalogs.list()):  # type: ignore[attr-defined]
                     raise RuntimeError(f"Catalog not found: {catalog}")
             else:
                 if not any(True for _ in self._schemas.list(catalog_name=catalog)):  # type: ignore[attr-defined]
                     raise RuntimeError(f"Catalog not found: {catalog}")
         except Exception as e:
-            if self._is_perm_error(str(e)):
+            # 403 from get() surfaces as PermissionDenied, whose message need not say "permission"
+            if isinstance(e, PermissionDenied) or self._is_perm_error(str(e)):
                 raise RuntimeError(f"Permission error verifying catalog '{catalog}': {e}") from e
             raise RuntimeError(f"Failed to verify catalog '{catalog}': {e}") from e
+        _METADATA_CACHE.set(key, True)
 
     def _assert_schema_exists(self, catalog: str, schema: str) -> None:
+        key = self._cache_key("schema", catalog, schema)
+        if _METADATA_CACHE.get(key):
+            return
         try:
-            if not any(s.name == schema for s in self._schemas.list(catalog_name=catalog)):  # type: ignore[attr-defined]
+            if self._schemas_get is not None:
+                try:
+                    self._schemas_get(full_name=f"{catalog}.{schema}")
+                except NotFound:
+                    raise RuntimeError(f"Schema not found: {catalog}.{schema}")
+            elif not any(s.name == schema for s in self._schemas.list(catalog_name=catalog)):  # type: ignore[attr-defined]
                 raise RuntimeError(f"Schema not found: {catalog}.{schema}")
         except Exception as e:
-            if self._is_perm_error(str(e)):
+            if isinstance(e, PermissionDenied) or self._is_perm_error(str(e)):
                 raise RuntimeError(f"Permission error verifying schema '{catalog}.{schema}': {e}") from e
             raise RuntimeError(f"Failed to verify schema '{catalog}.{schema}': {e}") from e
+        _METADATA_CACHE.set(key, True)
 
     def _list_schema_names(self, catalog: str) -> List[str]:
+        key = self._cache_key("schemas", catalog)
+        hit = _METADATA_CACHE.get(key)
+        if hit is not None:
+            return list(hit)
         try:
-            return [s.name for s in self._schemas.list(catalog_name=catalog)]  # type: ignore[attr-defined]
+            names = [s.name for s in self._schemas.list(catalog_name=catalog)]  # type: ignore[attr-defined]
         except Exception as e:
             if self._is_perm_error(str(e)):
                 raise RuntimeError(f"Permission error listing schemas for catalog '{catalog}': {e}") from e
             raise RuntimeError(f"Failed to list schemas for catalog '{catalog}': {e}") from e
+        _METADATA_CACHE.set(key, tuple(names))
+        return names
 
     def _keep_table_name(self, tbl_name: str) -> bool:
+        if self._exclude_re is not None:
+            return self._exclude_re.match(tbl_name) is None
+        if not self._excl_buckets:
+            return True
         n = tbl_name.lower()
-        if self.exclude_prefixes and any(n.startswith(p) for p in self.exclude_prefixes):
-            return False
-        if self.exclude_prefix_single and n.startswith(self.exclude_prefix_single):
-            return False
-        return True
+        return not any(n[:L] in bucket for L, bucket in self._excl_buckets.items())
 
     def _list_tables_for_schema(self, catalog: str, schema: str) -> List[str]:
-        out: List[str] = []
+        return list(self._iter_tables_for_schema(catalog, schema))
+
+    def _list_tables_via_info_schema(self, catalog: str, schemas: Iterable[str] = ()) -> Dict[str, List[str]]:
+        """
+        {schema (lowercased) -> kept table FQNs} for a catalog from one query; {} if unavailable.
+        Schemas whose rows were all filtered out still appear (with an empty list).
+        FQNs use the spelling from `schemas` (the SDK listing) when a schema is in it.
+        """
+        spelled = {sch.lower(): sch for sch in schemas}
+        try:
+            rows = self.spark.sql(
+                "SELECT table_schema, table_name, table_type FROM system.information_schema.tables "
+                "WHERE table_catalog = :c",
+                args={"c": catalog.lower()},
+            ).collect()
+        except Exception:
+            return {}
+        out: Dict[str, List[str]] = {}
+        for r in rows:
+            tname = r["table_name"]
+            key = str(r["table_schema"]).lower()
+            schema = spelled.get(key, r["table_schema"])
+            found = out.setdefault(key, [])
+            if (not self.include_views) and is_view(r["table_type"]):
+                continue
+            if not self._keep_table_name(tname):
+                continue
+            found.append(f"{catalog}.{schema}.{tname}")
+        return out
+
+    def _list_tables_for_schema_or_skip(self, catalog: str, schema: str) -> List[str]:
+        try:
+            return self._list_tables_for_schema(catalog, schema)
+        except Exception as e:
+            self._skipped.append(f"{catalog}.{schema}")
+            if self._is_perm_error(str(e)):
+                print(f"{Print.WARN}Skipping {catalog}.{schema} (permission): {e}")
+            else:
+                print(f"{Print.WARN}Skipping {catalog}.{schema}: {e}")
+            return []
+
+    def _iter_tables_for_schema(self, catalog: str, schema: str) -> Iterator[str]:
         try:
             itr = self._tables.list(catalog_name=catalog, schema_name=schema)  # type: ignore[attr-defined]
         except Exception as e:
             if self._is_perm_error(str(e)):
+                self._skipped.append(f"{catalog}.{schema}")
                 print(f"{Print.WARN}Permission error listing tables for {catalog}.{schema}: {e}")
-                return out
+                return
             raise
+        prefix = f"{catalog}.{schema}."
         for t in itr:
             tname = getattr(t, "name", None)
-            ttype = getattr(t, "table_type", None)
             if not tname:
                 continue
-            if (not self.include_views) and is_view(ttype):
+            if (not self.include_views) and is_view(getattr(t, "table_type", None)):
                 continue
             if not self._keep_table_name(tname):
                 continue
-            out.append(f"{t.catalog_name}.{t.schema_name}.{tname}")
-        return out
+            yield prefix + tname
 
     # ---- columns (single DRY point) ----
     def _tables_get(self, fqn: str):
@@ -439,21 +823,58 @@ class TableDiscovery:
             return get(full_name=fqn)  # type: ignore[misc]
 
     def _columns_for_table(self, fqn: str) -> Dict[str, str]:
-        # SDK
+        key = self._cache_key("columns", fqn)
+        hit = _METADATA_CACHE.get(key)
+        if hit is not None:
+            return dict(hit)
+        cmap = self._columns_via_sdk(fqn) or self._columns_via_spark_describe(fqn)
+        if cmap:
+            _METADATA_CACHE.set(key, dict(cmap))
+        return cmap
+
+    def _columns_via_sdk(self, fqn: str) -> Dict[str, str]:
         try:
             info = self._tables_get(fqn)
             cols = getattr(info, "columns", None)
             if cols:
-                out = {
+                return {
                     getattr(c, "name"): str(getattr(c, "type_text", None) or getattr(c, "type_name", None))
                     for c in cols
                     if getattr(c, "name", None) and (getattr(c, "type_text", None) or getattr(c, "type_name", None))
                 }
-                if out:
-                    return out
         except Exception:
             pass
-        # Spark DESCRIBE
+        return {}
+
+    def _bulk_columns_for_schema(self, catalog: str, schema: str, tables: List[str]) -> Dict[str, Dict[str, str]]:
+        """{table (lowercased) -> {col: dtype}} for the named tables of one schema in one query; {} if unavailable."""
+        names = {f"t{i}": t.lower() for i, t in enumerate(tables)}
+        try:
+            rows = self.spark.sql(
+                "SELECT table_name, column_name, full_data_type FROM system.information_schema.columns "
+                "WHERE table_catalog = :c AND table_schema = :s "
+                f"AND table_name IN ({', '.join(':' + k for k in names)}) "
+                "ORDER BY table_name, ordinal_position",
+                args={"c": catalog.lower(), "s": schema.lower(), **names},
+            ).collect()
+        except Exception:
+            return {}
+        out: Dict[str, Dict[str, str]] = {}
+        for r in rows:
+            out.setdefault(str(r["table_name"]).lower(), {})[r["column_name"]] = r["full_data_type"]
+        return out
+
+    def _columns_via_spark_describe(self, fqn: str) -> Dict[str, str]:
+        # analyzed schema is a metastore lookup; DESCRIBE runs a job, so only on failure
+        try:
+            return {
+                # CHAR(n)/VARCHAR(n) surface as string; the declared type (what DESCRIBE shows) is in metadata
+                f.name: (getattr(f, "metadata", None) or {}).get("__CHAR_VARCHAR_TYPE_STRING")
+                or f.dataType.simpleString()
+                for f in self.spark.table(fqn).schema.fields
+            }
+        except Exception:
+            pass
         try:
             rows = self.spark.sql(f"DESCRIBE {fqn}").collect()
         except Exception as e:
@@ -471,15 +892,73 @@ class TableDiscovery:
         return out
 
     def _materialize_columns(self, tables: Iterable[str]) -> Dict[str, Dict[str, str]]:
-        return {t: self._columns_for_table(t) for t in tables}
+        """
+        Cache first; uncached tables start pooled SDK tables.get calls while `tables` is still
+        streaming in. With use_information_schema, a schema's tables beyond its first
+        _BULK_MIN_TABLES are instead batched into information_schema queries filtered to those
+        tables. Anything still empty (e.g. views without column access) falls back to DESCRIBE.
+        """
+        out: Dict[str, Dict[str, str]] = {}
+        misses: List[str] = []
+        singles: List[Tuple[str, Future]] = []
+        seen: Dict[Tuple[str, str], int] = defaultdict(int)
+        batches: Dict[Tuple[str, str], List[str]] = {}
+        bulk: List[Tuple[List[str], Future]] = []
+        with ThreadPoolExecutor(max_workers=self.column_workers) as ex:
+
+            def submit_bulk(key: Tuple[str, str], batch: List[str]) -> None:
+                names = [t.rsplit(".", 1)[1] for t in batch]
+                bulk.append((batch, ex.submit(self._bulk_columns_for_schema, key[0], key[1], names)))
+
+            for t in tables:
+                hit = _METADATA_CACHE.get(self._cache_key("columns", t))
+                if hit is not None:
+                    out[t] = dict(hit)
+                    continue
+                out[t] = {}
+                misses.append(t)
+                parsed = _parse_fqn(t)
+                if parsed is not None and self.use_information_schema:
+                    # bulk rows come from the Spark identity, so this path is opt-in (see ctor)
+                    key = parsed[:2]
+                    seen[key] += 1
+                    if seen[key] > _BULK_MIN_TABLES:
+                        batch = batches.setdefault(key, [])
+                        batch.append(t)
+                        if len(batch) >= _BULK_CHUNK:
+                            submit_bulk(key, batch)
+                            batches[key] = []
+                        continue
+                singles.append((t, ex.submit(self._columns_via_sdk, t)))
+
+            for key, batch in batches.items():
+                if batch:
+                    submit_bulk(key, batch)
+
+            for t, fut in singles:
+                out[t] = fut.result() or self._columns_via_spark_describe(t)
+            for batch, fut in bulk:
+                found = fut.result()
+                for t in batch:
+                    out[t] = found.get(t.rsplit(".", 1)[1].lower(), {})
+            pending = [t for batch, _ in bulk for t in batch if not out[t]]
+            for t, cmap in zip(pending, ex.map(self._columns_via_sdk, pending)):
+                out[t] = cmap or self._columns_via_spark_describe(t)
+        for t in misses:
+            if out[t]:
+                _METADATA_CACHE.set(self._cache_key("columns", t), dict(out[t]))
+        return out
 
     # ---- per-class utils ----
     @staticmethod
     def _normalize_txt_name(name: Union[str, bool, None]) -> str:
         if name is True or not name:
             return "tree.txt"
-        p = Path(str(name).strip())
-        return p.name if p.suffix.lower() == ".txt" else f"{p.stem}.txt"
+        s = str(name).strip().rstrip("/")
+        base = s[s.rfind("/") + 1:]
+        if len(base) > 4 and base.lower().endswith(".txt"):
+            return base
+        return f"{base.rsplit('.', 1)[0] if base.rfind('.') > 0 else base}.txt"
 
     @staticmethod
     def _write_text(path: Union[str, Path], text: str, overwrite: bool = True) -> Path:
@@ -498,10 +977,11 @@ class TableDiscovery:
         p.write_text(text, encoding="utf-8")
         return p
 
+    _PERM_RE = re.compile(r"403|permission|unauthorized|access denied", re.IGNORECASE)
+
     @staticmethod
     def _is_perm_error(msg: str) -> bool:
-        m = msg.upper()
-        return ("403" in m) or ("PERMISSION" in m) or ("UNAUTHORIZED" in m) or ("ACCESS DENIED" in m)
+        return TableDiscovery._PERM_RE.search(msg) is not None
         
 
 
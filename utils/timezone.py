@@ -1,18 +1,23 @@
 # utils/timezone.py
 
-from datetime import datetime
+from datetime import datetime as _dt
+from functools import lru_cache
 from zoneinfo import ZoneInfo
 from typing import Optional
 
+@lru_cache(maxsize=64)
+def _zone(time_zone: str) -> ZoneInfo:
+    return ZoneInfo(time_zone)
+
 def current_time_iso(time_zone: Optional[str] = "UTC") -> str:
     """
     Return the current datetime as an ISO 8601 string with timezone.
     """
     try:
-        zone = ZoneInfo(time_zone)
+        zone = _zone(time_zone)
     except Exception as e:
         raise ValueError(
             f"Invalid timezone '{time_zone}'. Must be a valid IANA timezone string. "
             "Examples: 'UTC', 'America/Chicago', 'Europe/Berlin'."
         ) from e
-    return datetime.now(zone).isoformat()
+    return _dt.now(zone).isoformat()
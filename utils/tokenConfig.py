@@ -34,20 +34,31 @@ Workflow:
             * Stores path to token-management.yaml and the target environment string.
             * Retrieves DBUtils via get_dbutils(spark) if a SparkSession is provided.
             * Loads the YAML into self._config and extracts self._env_config for the given env.
+            * Resolves the five (scope, key) secret lookups into self._secret_specs, failing
+              fast if any of them is missing from the config.
     2. load_config():
-        - Opens and parses the YAML file at config_path into self._config.
+        - Opens and parses the YAML file at config_path into self._config (libyaml CSafeLoader
+          when available, SafeLoader otherwise).
+        - Parses are memoized per (absolute path, mtime) across instances.
         - Raises an exception if file I/O or parsing fails.
     3. load_secrets():
         - Reads tenant_id, client_id, client_secret, resource, and instance values from
-          DBUtils secrets or OS environment variables.
+          DBUtils secrets (fetched concurrently) or OS environment variables.
         - Constructs the Azure AD token endpoint URL using tenant_id.
-        - Sends an HTTP POST to obtain an OAuth access token.
+        - Sends an HTTP POST to obtain an OAuth access token over a shared keep-alive
+          session (retries transient 429/5xx, 5s connect / 15s read timeout).
         - Raises an exception on non-200 responses or missing access_token.
-        - Normalizes the Databricks instance URL by stripping protocol and trailing slashes.
+        - Normalizes the Databricks instance URL with urlsplit (drops any scheme, whitespace,
+          and trailing slashes) and re-prefixes it with https://.
         - Returns a tuple (full_instance_url, access_token).
-    4. __iter__():
+        - Caches the tuple until 60 seconds before the token's 'expires_in'; later calls
+          (properties, unpacking) reuse it without any secret reads or HTTP requests.
+    4. load_many(config_path, envs, spark) (classmethod):
+        - Builds one TokenConfig per env and runs their load_secrets() concurrently.
+        - Returns {env: (full_instance_url, access_token)}.
+    5. __iter__():
         - Enables unpacking: instance_url, token = TokenConfig(...)
-    5. Properties:
+    6. Properties:
         - databricks_token: Returns {"client_secret": <access_token>}.
         - databricks_instance: Returns the workspace URL.
 
@@ -74,6 +85,10 @@ Usage Examples:
     cfg = TokenConfig("/path/to/token-management.yaml", "prd")
     instance_url, token = cfg.load_secrets()
 
+    # 4) Several environments at once:
+    tokens = TokenConfig.load_many("/path/to/token-management.yaml", ["dev", "tst", "prd"], spark)
+    instance_url, token = tokens["prd"]
+
 Note:
     - Requires DBUtils for secret retrieval in Databricks runtime; otherwise falls back to env vars.
     - Depends on the 'databricks_token_config.prd' section in token-management.yaml.
@@ -84,11 +99,54 @@ Created Date: 2025-04-06
 Last Modified: 2025-04-16
 """
 
+from __future__ import annotations
+
+import copy
 import os
+import time
 import yaml
 import requests
-from typing import Any, Dict, Tuple
-from pyspark.sql import SparkSession
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from urllib.parse import urlencode, urlsplit
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:  # only used in annotations; importing pyspark is slow
+    from pyspark.sql import SparkSession
+
+try:  # libyaml-backed loader when PyYAML was built with it
+    from yaml import CSafeLoader as _YAMLLoader
+except ImportError:
+    from yaml import SafeLoader as _YAMLLoader
+
+# One keep-alive session for the Azure AD token endpoint, so refreshes skip the TLS handshake.
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=4,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.25,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=frozenset({"POST"}),
+            raise_on_status=False,
+        ),
+    ),
+)
+_TOKEN_TIMEOUT = (5, 15)  # (connect, read) seconds
+_FORM_HEADERS = {"Content-Type": "application/x-www-form-urlencoded"}
+
+@lru_cache(maxsize=32)
+def _load_yaml_cached(path: str, mtime_ns: int) -> Any:
+    """
+    Parses the YAML file at path; keyed on mtime so an edited file is re-read.
+    """
+    with open(path, "r") as f:
+        return yaml.load(f.read(), Loader=_YAMLLoader)
 
 def get_dbutils(spark: SparkSession) -> Any:
     """
@@ -114,6 +172,11 @@ class TokenConfig:
     Manages retrieval of the Databricks workspace URL and OAuth access token
     using a token-management YAML file and DBUtils or environment variables.
     """
+    __slots__ = (
+        "spark", "dbutils", "config_path", "_config", "env", "_env_config",
+        "_cached", "_expires_at", "_secret_specs", "_payload_cache",
+    )
+
     def __init__(self, config_path: str, env: str, spark: SparkSession = None) -> None:
         """
         Initializes TokenConfig with the token-management YAML file, environment string,
@@ -127,6 +190,9 @@ class TokenConfig:
         self.dbutils = get_dbutils(spark) if spark is not None else None
         self.config_path = config_path
         self._config: Dict[str, Any] = {}
+        self._cached: Optional[Tuple[str, str]] = None
+        self._expires_at: float = 0.0
+        self._payload_cache: Optional[Tuple[Tuple[Optional[str], ...], bytes]] = None
         self.load_config()
         self.env = env.lower()
         try:
@@ -135,19 +201,52 @@ class TokenConfig:
             raise Exception(
                 f"No token configuration found for environment '{self.env}' in {config_path}"
             )
+        try:
+            token_cfg = self._env_config["databricks_token"]
+            instance_cfg = self._env_config["databricks_instance"]
+            # resolved once; load_secrets only walks this flat list
+            self._secret_specs: List[Tuple[str, str, str]] = [
+                ("tenant_id", token_cfg["tenant_id"]["scope"], token_cfg["tenant_id"]["key"]),
+                ("client_id", token_cfg["client_id"]["scope"], token_cfg["client_id"]["key"]),
+                ("client_secret", token_cfg["client_secret"]["scope"], token_cfg["client_secret"]["key"]),
+                ("resource", token_cfg["resource"]["scope"], token_cfg["resource"]["key"]),
+                ("instance", instance_cfg["instance_scope"], instance_cfg["instance_key"]),
+            ]
+        except (KeyError, TypeError) as e:
+            raise Exception(
+                f"Missing token or instance configuration {e} for environment '{self.env}' in {config_path}"
+            )
 
     def load_config(self) -> None:
         """
         Loads the token-management YAML configuration file into self._config.
         """
         try:
-            with open(self.config_path, "r") as f:
-                self._config = yaml.safe_load(f)
+            path = os.path.abspath(self.config_path)
+            self._config = copy.deepcopy(_load_yaml_cached(path, os.stat(path).st_mtime_ns))
         except Exception as e:
             raise Exception(
                 f"Error loading token management YAML from {self.config_path}: {e}"
             )
 
+    def _read_secrets(self, specs: List[Tuple[str, str, str]]) -> Dict[str, Optional[str]]:
+        """
+        Resolves (name, scope, key) specs into a {name: value} dict.
+
+        Each dbutils.secrets.get is a blocking py4j round-trip and the keys are
+        independent, so they are fetched concurrently rather than one after another.
+        Without DBUtils the values come from environment variables named by key.
+
+        :param specs: List of (name, scope, key) tuples.
+        :return: Dict mapping each name to its secret value.
+        """
+        if self.dbutils is None:
+            return {name: os.environ.get(key) for name, _, key in specs}
+        get = self.dbutils.secrets.get
+        with ThreadPoolExecutor(max_workers=len(specs)) as pool:
+            futures = {name: pool.submit(get, scope=scope, key=key) for name, scope, key in specs}
+            return {name: fut.result() for name, fut in futures.items()}
+
     def load_secrets(self) -> Tuple[str, str]:
         """
         Retrieves and returns a tuple (full_instance_url, access_token).
@@ -155,51 +254,39 @@ class TokenConfig:
         - full_instance_url: Databricks instance URL with 'https://' and no trailing slash.
         - access_token: OAuth bearer token.
 
+        The result is cached until shortly before the token expires.
+
         :return: Tuple(full_instance_url, access_token).
         """
-        token_cfg = self._env_config.get("databricks_token")
-        instance_cfg = self._env_config.get("databricks_instance")
-        if not token_cfg or not instance_cfg:
-            raise Exception(
-                f"Missing token or instance configuration for environment '{self.env}'"
-            )
+        if self._cached is not None and time.monotonic() < self._expires_at:
+            return self._cached
 
-        if self.dbutils is not None:
-            tenant_id = self.dbutils.secrets.get(
-                scope=token_cfg["tenant_id"]["scope"],
-                key=token_cfg["tenant_id"]["key"]
-            )
-            client_id = self.dbutils.secrets.get(
-                scope=token_cfg["client_id"]["scope"],
-                key=token_cfg["client_id"]["key"]
-            )
-            client_secret = self.dbutils.secrets.get(
-                scope=token_cfg["client_secret"]["scope"],
-                key=token_cfg["client_secret"]["key"]
-            )
-            resource = self.dbutils.secrets.get(
-                scope=token_cfg["resource"]["scope"],
-                key=token_cfg["resource"]["key"]
-            )
-            instance = self.dbutils.secrets.get(
-                scope=instance_cfg["instance_scope"],
-                key=instance_cfg["instance_key"]
-            )
-        else:
-            tenant_id = os.environ.get(token_cfg["tenant_id"]["key"])
-            client_id = os.environ.get(token_cfg["client_id"]["key"])
-            client_secret = os.environ.get(token_cfg["client_secret"]["key"])
-            resource = os.environ.get(token_cfg["resource"]["key"])
-            instance = os.environ.get(instance_cfg["instance_key"])
+        secrets = self._read_secrets(self._secret_specs)
+        tenant_id = secrets["tenant_id"]
+        client_id = secrets["client_id"]
+        client_secret = secrets["client_secret"]
+        resource = secrets["resource"]
+        instance = secrets["instance"]
 
         token_url = f"https://login.microsoftonline.com/{tenant_id}/oauth2/token"
-        payload = {
-            "grant_type": "client_credentials",
-            "client_id": client_id,
-            "client_secret": client_secret,
-            "resource": resource
-        }
-        response = requests.post(token_url, data=payload)
+        # the form body only changes when a credential rotates, so reuse the encoded bytes
+        creds = (client_id, client_secret, resource)
+        if self._payload_cache is None or self._payload_cache[0] != creds:
+            payload = {
+                "grant_type": "client_credentials",
+                "client_id": client_id,
+                "client_secret": client_secret,
+                "resource": resource
+            }
+            # requests drops None-valued fields from a dict body; keep that behavior
+            encoded = urlencode({k: v for k, v in payload.items() if v is not None}).encode("ascii")
+            self._payload_cache = (creds, encoded)
+        response = _SESSION.post(
+            token_url,
+            data=self._payload_cache[1],
+            headers=_FORM_HEADERS,
+            timeout=_TOKEN_TIMEOUT,
+        )
         if response.status_code != 200:
             raise Exception(
                 f"Failed to retrieve token. Status: {response.status_code}, Response: {response.text}"
@@ -209,15 +296,40 @@ class TokenConfig:
         if not access_token:
             raise Exception("Failed to retrieve access token from OAuth response.")
 
-        # Normalize the instance URL
-        instance = instance.rstrip("/")
-        if instance.startswith("https://"):
-            instance = instance[len("https://"):]
-        elif instance.startswith("http://"):
-            instance = instance[len("http://"):]
-        full_instance_url = f"https://{instance}"
+        # Normalize the instance URL (any scheme/case, whitespace, trailing slashes)
+        instance = instance.strip()
+        parts = urlsplit(instance if "://" in instance else f"https://{instance}")
+        host = parts.netloc or parts.path
+        full_instance_url = f"https://{host.rstrip('/')}"
+
+        # refresh a minute early so callers never hold a token that is about to lapse
+        expires_in = float(token_json.get("expires_in", 3600))
+        self._expires_at = time.monotonic() + expires_in - 60
+        self._cached = (full_instance_url, access_token)
+        return self._cached
+
+    @classmethod
+    def load_many(
+        cls, config_path: str, envs: List[str], spark: SparkSession = None
+    ) -> Dict[str, Tuple[str, str]]:
+        """
+        Fetches (full_instance_url, access_token) for several environments at once.
+
+        The configs are built up front (so config errors surface immediately), then
+        each environment's secret reads and OAuth POST run on their own thread over
+        the shared keep-alive session.
 
-        return full_instance_url, access_token
+        :param config_path: Path to token-management.yaml.
+        :param envs: Environment strings (e.g., ["dev", "tst", "prd"]).
+        :param spark: SparkSession for DBUtils; if None, falls back to environment variables.
+        :return: Dict mapping each env to its (full_instance_url, access_token).
+        """
+        configs = {env: cls(config_path, env, spark) for env in envs}
+        if not configs:
+            return {}
+        with ThreadPoolExecutor(max_workers=len(configs)) as pool:
+            futures = {env: pool.submit(cfg.load_secrets) for env, cfg in configs.items()}
+            return {env: fut.result() for env, fut in futures.items()}
 
     def __iter__(self):
         """
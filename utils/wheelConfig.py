@@ -11,13 +11,20 @@ Features:
 5. `repack_wheel`: Repackages a modified wheel directory into a new wheel file.
 6. `inspect_wheel_metadata`: Inspects and displays metadata from the wheel.
 7. `list_dependencies`: Lists dependencies from the wheel's METADATA file.
+8. `open_wheel`: Opens a wheel once and returns the `ZipFile`, or None if it is not a valid wheel.
+
+The wheel-reading functions (`unpack_wheel`, `list_wheel_contents`, `inspect_wheel_metadata`,
+`list_dependencies`) accept either a path or an open `ZipFile`, so one handle from `open_wheel`
+can be reused instead of re-reading the archive's central directory for every call.
 
 This script is designed to be used as an example tool for showcasing in a repository.
 
 How to Run:
 - Ensure you have Python installed along with the `zipfile` and `os` modules (both are standard).
-- Copy the script into a `.py` file or run it directly in a Jupyter Notebook.
-- Update the `wheel_path`, `folder_to_zip`, and `zip_file_name` variables with your paths.
+- Import the functions, or run the module as a script (importing it has no side effects):
+    python -m utils.wheelConfig inspect path_to_your_wheel_file.whl [--extract-to DIR]
+    python -m utils.wheelConfig zip path_to_your_unpacked_directory path_to_output_zip_file.zip
+    python -m utils.wheelConfig repack path_to_directory new_wheel_file.whl
 
 Example Usage:
 - Unpack a wheel file: `unpack_wheel('path_to_your_wheel_file.whl')`
@@ -27,27 +34,200 @@ Example Usage:
 - Repack a wheel: `repack_wheel('path_to_directory', 'output_wheel_file.whl')`
 - Inspect metadata: `inspect_wheel_metadata('path_to_your_wheel_file.whl')`
 - List dependencies: `list_dependencies('path_to_your_wheel_file.whl')`
+- Reuse one handle: `with open_wheel('path_to_your_wheel_file.whl') as whl: list_dependencies(whl)`
 
 Author: Levi Gagne
 """
 
+import io
+import re
+import sys
+import zlib
 import zipfile
 import os
+import shutil
+from collections import deque
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+
+_DEFLATE_WORKERS = min(8, os.cpu_count() or 1)
+_INLINE_MAX_BYTES = 16 << 20    # larger files skip the pool and stream through ZipFile.write
+_INFLIGHT_MAX_BYTES = 64 << 20  # cap on source bytes read into memory by pending pool tasks
+_COPY_BUFSIZE = 1 << 20  # 1 MiB; zipfile's own extract copies 8 KiB at a time
+
+# Members that are already compressed; repack_wheel stores these instead of deflating again
+_STORED_EXTENSIONS = frozenset({
+    '.whl', '.zip', '.jar', '.egg', '.gz', '.tgz', '.bz2', '.xz', '.zst',
+    '.png', '.jpg', '.jpeg', '.gif', '.webp',
+})
+
+# Requires-Dist lines, matched on the raw METADATA bytes so nothing else is decoded
+_REQ_RE = re.compile(rb"^Requires-Dist[^\r\n]*", re.MULTILINE)
+
+def _iter_file_paths(top):
+    """
+    Yield the path of every file under `top`, like the files of os.walk(top).
+
+    Uses an explicit os.scandir stack: DirEntry already knows its type, so there is no
+    extra stat per entry. Symlinked directories are not descended into, as with os.walk.
+    """
+    stack = [top]
+    while stack:
+        subdirs = []
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    if not entry.is_symlink():
+                        subdirs.append(entry.path)
+                else:
+                    yield entry.path
+        stack.extend(reversed(subdirs))
+
+def _deflate_file(file_path, arcname, store=False):
+    """
+    Read and raw-deflate one file, returning (ZipInfo, compressed_bytes).
+
+    Runs on a worker thread; zlib releases the GIL, so files compress in parallel.
+    The level matches ZipFile's ZIP_DEFLATED default, so output bytes are unchanged.
+    With `store=True` the bytes are kept as-is under ZIP_STORED.
+    """
+    zinfo = zipfile.ZipInfo.from_file(file_path, arcname, strict_timestamps=False)
+    with open(file_path, 'rb') as f:
+        data = f.read()
+    if store:
+        payload = data
+        zinfo.compress_type = zipfile.ZIP_STORED
+    else:
+        compressor = zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, -15)
+        payload = compressor.compress(data) + compressor.flush()
+        zinfo.compress_type = zipfile.ZIP_DEFLATED
+    zinfo.file_size = len(data)
+    zinfo.compress_size = len(payload)
+    zinfo.CRC = zlib.crc32(data)
+    return zinfo, payload
+
+def _write_precompressed(zipf, zinfo, payload):
+    """
+    Append an already-compressed member to `zipf` without recompressing it.
+
+    Mirrors what ZipFile.mkdir does for a directory entry: local header, then data,
+    then register the entry so close() writes it into the central directory.
+    """
+    if not zipf.fp:
+        raise ValueError("Attempt to write to ZIP archive that was already closed")
+    if zipf._writing:
+        raise ValueError("Can't write to ZIP archive while an open writing handle exists")
+    zip64 = zinfo.file_size > zipfile.ZIP64_LIMIT or zinfo.compress_size > zipfile.ZIP64_LIMIT
+    with zipf._lock:
+        if zipf._seekable:
+            zipf.fp.seek(zipf.start_dir)
+        zinfo.header_offset = zipf.fp.tell()
+        zipf._writecheck(zinfo)
+        zipf._didModify = True
+        zipf.fp.write(zinfo.FileHeader(zip64))
+        zipf.fp.write(payload)
+        zipf.filelist.append(zinfo)
+        zipf.NameToInfo[zinfo.filename] = zinfo
+        zipf.start_dir = zipf.fp.tell()
+
+def _write_tree(zipf, file_paths, arcname_for, stored_extensions=frozenset()):
+    """
+    Deflate `file_paths` on a thread pool and write them to `zipf` in the given order.
+
+    Files whose extension is in `stored_extensions` are written uncompressed. Files over
+    _INLINE_MAX_BYTES are streamed through ZipFile.write instead of being read whole, and
+    pending pool work is capped at _INFLIGHT_MAX_BYTES of source data.
+    """
+    with ThreadPoolExecutor(max_workers=_DEFLATE_WORKERS) as pool:
+        pending = deque()  # (future, source size), in archive order
+        inflight = 0
+
+        def drain(limit):
+            nonlocal inflight
+            while pending and inflight > limit:
+                future, size = pending.popleft()
+                _write_precompressed(zipf, *future.result())
+                inflight -= size
+
+        for file_path in file_paths:
+            arcname = arcname_for(file_path)
+            store = os.path.splitext(file_path)[1].lower() in stored_extensions
+            size = os.path.getsize(file_path)
+            if size > _INLINE_MAX_BYTES:
+                drain(-1)  # keep archive order: everything queued goes first
+                zipf.write(
+                    file_path,
+                    arcname,
+                    compress_type=zipfile.ZIP_STORED if store else zipfile.ZIP_DEFLATED,
+                )
+                continue
+            # charge small files a 64 KiB floor so the queue length stays bounded too
+            cost = max(size, 1 << 16)
+            drain(_INFLIGHT_MAX_BYTES - cost)
+            pending.append((pool.submit(_deflate_file, file_path, arcname, store), cost))
+            inflight += cost
+        drain(-1)
+
+@contextmanager
+def _wheel_zip(wheel):
+    """
+    Yield a ZipFile for `wheel` (a path or an open ZipFile).
+
+    Handles passed in by the caller are left open; paths are opened and closed here.
+    """
+    if isinstance(wheel, zipfile.ZipFile):
+        yield wheel
+    else:
+        with zipfile.ZipFile(wheel, 'r') as wheel_file:
+            yield wheel_file
+
+def open_wheel(wheel_path):
+    """
+    Open a wheel (.whl) file for reading.
+
+    Args:
+        wheel_path (str): Path to the wheel file.
+
+    Returns:
+        zipfile.ZipFile or None: The open archive (caller closes it), or None if the
+        path is not a .whl or not a valid zip.
+    """
+    if not wheel_path.endswith('.whl'):
+        return None
+    try:
+        return zipfile.ZipFile(wheel_path, 'r')
+    except (zipfile.BadZipFile, OSError):
+        return None
 
 def unpack_wheel(wheel_path, extract_to=None):
     """
     Unpack a wheel (.whl) file to a specified directory.
 
     Args:
-        wheel_path (str): Path to the .whl file.
+        wheel_path (str or zipfile.ZipFile): Path to the .whl file, or an open wheel.
         extract_to (str, optional): Directory to extract the files into. 
                                     If None, extracts to the same directory as the wheel file.
     """
     if extract_to is None:
-        extract_to = os.path.splitext(wheel_path)[0]  # Remove the .whl and use as directory name
+        source = wheel_path.filename if isinstance(wheel_path, zipfile.ZipFile) else wheel_path
+        extract_to = os.path.splitext(source)[0]  # Remove the .whl and use as directory name
 
-    with zipfile.ZipFile(wheel_path, 'r') as wheel_file:
-        wheel_file.extractall(extract_to)
+    root = os.path.abspath(extract_to)
+    made_dirs = set()
+    with _wheel_zip(wheel_path) as wheel_file:
+        for info in wheel_file.infolist():
+            dest = os.path.normpath(os.path.join(root, info.filename))
+            # extractall sanitizes names; here we refuse anything that escapes the target
+            if os.path.commonpath([root, dest]) != root:
+                raise ValueError(f"Unsafe path in wheel: {info.filename}")
+            target_dir = dest if info.is_dir() else os.path.dirname(dest)
+            if target_dir not in made_dirs:
+                os.makedirs(target_dir, exist_ok=True)
+                made_dirs.add(target_dir)
+            if info.is_dir():
+                continue
+            with wheel_file.open(info) as src, open(dest, 'wb') as dst:
+                shutil.copyfileobj(src, dst, _COPY_BUFSIZE)
         print(f"Wheel file extracted to: {extract_to}")
 
 def zip_folder(folder_path, output_path):
@@ -58,25 +238,26 @@ def zip_folder(folder_path, output_path):
         folder_path (str): Path to the folder to be zipped.
         output_path (str): Output zip file path.
     """
+    base = os.path.dirname(os.path.abspath(folder_path))  # arcnames keep the folder itself
     with zipfile.ZipFile(output_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-        for root, dirs, files in os.walk(folder_path):
-            for file in files:
-                zipf.write(
-                    os.path.join(root, file),
-                    os.path.relpath(os.path.join(root, file),
-                                    os.path.join(folder_path, '..'))
-                )
+        _write_tree(zipf, _iter_file_paths(folder_path), lambda p: os.path.relpath(p, base))
 
 def validate_wheel(wheel_path):
     """
     Validate if a file is a proper wheel (.whl) file.
 
+    An open ZipFile (e.g. from `open_wheel`) is already known to be a zip, so only its
+    name is checked. For a path, is_zipfile only reads the end-of-central-directory
+    record at the tail of the file, never the whole archive.
+
     Args:
-        wheel_path (str): Path to the wheel file.
+        wheel_path (str or zipfile.ZipFile): Path to the wheel file, or an open wheel.
 
     Returns:
         bool: True if the file is a valid wheel, False otherwise.
     """
+    if isinstance(wheel_path, zipfile.ZipFile):
+        return bool(wheel_path.filename) and wheel_path.filename.endswith('.whl')
     return wheel_path.endswith('.whl') and zipfile.is_zipfile(wheel_path)
 
 def list_wheel_contents(wheel_path):
@@ -84,27 +265,30 @@ def list_wheel_contents(wheel_path):
     List the contents of a wheel (.whl) file without extracting.
 
     Args:
-        wheel_path (str): Path to the wheel file.
+        wheel_path (str or zipfile.ZipFile): Path to the wheel file, or an open wheel.
     """
-    with zipfile.ZipFile(wheel_path, 'r') as wheel_file:
+    with _wheel_zip(wheel_path) as wheel_file:
         print("Contents of the wheel file:")
-        for file_name in wheel_file.namelist():
-            print(f"- {file_name}")
+        for info in wheel_file.infolist():
+            print(f"- {info.filename}")
 
 def repack_wheel(source_dir, output_wheel):
     """
     Repack a directory into a new wheel (.whl) file.
 
+    Already-compressed members (archives, images) are stored rather than deflated again.
+
     Args:
         source_dir (str): Path to the unpacked directory.
         output_wheel (str): Path for the new wheel file.
     """
     with zipfile.ZipFile(output_wheel, 'w', zipfile.ZIP_DEFLATED) as wheel_file:
-        for root, dirs, files in os.walk(source_dir):
-            for file in files:
-                file_path = os.path.join(root, file)
-                arcname = os.path.relpath(file_path, source_dir)
-                wheel_file.write(file_path, arcname)
+        _write_tree(
+            wheel_file,
+            _iter_file_paths(source_dir),
+            lambda p: os.path.relpath(p, source_dir),
+            _STORED_EXTENSIONS,
+        )
     print(f"New wheel file created: {output_wheel}")
 
 def inspect_wheel_metadata(wheel_path):
@@ -112,45 +296,72 @@ def inspect_wheel_metadata(wheel_path):
     Display the metadata of a wheel (.whl) file.
 
     Args:
-        wheel_path (str): Path to the wheel file.
+        wheel_path (str or zipfile.ZipFile): Path to the wheel file, or an open wheel.
     """
-    with zipfile.ZipFile(wheel_path, 'r') as wheel_file:
-        metadata_files = [f for f in wheel_file.namelist() if f.endswith(('METADATA', 'WHEEL'))]
-        for metadata_file in metadata_files:
-            with wheel_file.open(metadata_file) as meta:
-                print(f"--- {metadata_file} ---")
-                print(meta.read().decode())
+    with _wheel_zip(wheel_path) as wheel_file:
+        for info in wheel_file.infolist():
+            if not info.filename.endswith(('/METADATA', '/WHEEL')):
+                continue
+            print(f"--- {info.filename} ---")
+            # stream straight to stdout rather than holding the bytes and the decoded str
+            with io.TextIOWrapper(wheel_file.open(info), encoding='utf-8', newline='') as meta:
+                shutil.copyfileobj(meta, sys.stdout, 1 << 16)
+            print()
 
 def list_dependencies(wheel_path):
     """
     List dependencies from the METADATA file of a wheel (.whl).
 
     Args:
-        wheel_path (str): Path to the wheel file.
+        wheel_path (str or zipfile.ZipFile): Path to the wheel file, or an open wheel.
     """
-    with zipfile.ZipFile(wheel_path, 'r') as wheel_file:
-        metadata_file = next((f for f in wheel_file.namelist() if f.endswith('METADATA')), None)
+    with _wheel_zip(wheel_path) as wheel_file:
+        # infolist() is the archive's own entry list; namelist() would copy every name first
+        metadata_file = next((i for i in wheel_file.infolist() if i.filename.endswith('METADATA')), None)
         if metadata_file:
             with wheel_file.open(metadata_file) as meta:
-                for line in meta.read().decode().splitlines():
-                    if line.startswith('Requires-Dist'):
-                        print(line)
+                for match in _REQ_RE.finditer(meta.read()):
+                    print(match.group(0).decode())
         else:
             print("No METADATA file found in the wheel.")
 
-"""
-# Example usages
-wheel_path = 'path_to_your_wheel_file.whl'  # Replace with your wheel file path
-if validate_wheel(wheel_path):
-    unpack_wheel(wheel_path)
-    list_wheel_contents(wheel_path)
-    inspect_wheel_metadata(wheel_path)
-    list_dependencies(wheel_path)
-else:
-    print(f"Invalid wheel file: {wheel_path}")
-
-folder_to_zip = 'path_to_your_unpacked_wheel_directory'  # Replace with your folder path
-zip_file_name = 'path_to_output_zip_file.zip'  # Replace with your desired zip file name
-zip_folder(folder_to_zip, zip_file_name)
-repack_wheel('path_to_directory', 'new_wheel_file.whl')
-"""
\ No newline at end of file
+def _main(argv=None):
+    """
+    Command-line entry point mirroring the example usages above.
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Inspect, unpack and repack Python wheel files.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    inspect = sub.add_parser("inspect", help="Unpack a wheel and show its contents, metadata and dependencies.")
+    inspect.add_argument("wheel_path")
+    inspect.add_argument("--extract-to", default=None)
+
+    zip_cmd = sub.add_parser("zip", help="Zip a folder (including subfolders).")
+    zip_cmd.add_argument("folder_path")
+    zip_cmd.add_argument("output_path")
+
+    repack = sub.add_parser("repack", help="Repack an unpacked wheel directory into a .whl.")
+    repack.add_argument("source_dir")
+    repack.add_argument("output_wheel")
+
+    args = parser.parse_args(argv)
+    if args.command == "inspect":
+        wheel = open_wheel(args.wheel_path)
+        if wheel is None:
+            print(f"Invalid wheel file: {args.wheel_path}")
+            return 1
+        with wheel:
+            unpack_wheel(wheel, args.extract_to)
+            list_wheel_contents(wheel)
+            inspect_wheel_metadata(wheel)
+            list_dependencies(wheel)
+    elif args.command == "zip":
+        zip_folder(args.folder_path, args.output_path)
+    else:
+        repack_wheel(args.source_dir, args.output_wheel)
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(_main())
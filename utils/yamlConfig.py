@@ -15,11 +15,12 @@ Workflow:
         - Retrieves the dbutils instance via get_dbutils().
         - Stores the path to the YAML config file.
         - Calls load_config() to read and parse the YAML into self._config.
-        - Calls build_full_table_name() to generate and store the fully
-          qualified table name using the provided env.
+        - Leaves the fully qualified table name unset; it is built on first access.
     3. load_config():
         - Opens the YAML file at config_path.
-        - Parses its contents with yaml.safe_load into self._config.
+        - Parses its contents with the libyaml CSafeLoader (SafeLoader fallback) into self._config.
+        - Parses are memoized per (absolute path, mtime), so repeated instances over
+          an unchanged file skip the parser; each instance gets its own copy.
         - Raises an exception if file access or parsing fails.
     4. build_full_table_name():
         - Extracts 'catalog', 'schema', and 'table_name' from
@@ -27,15 +28,38 @@ Workflow:
         - Uses the self.env attribute (no fallback allowed).
         - Concatenates catalog + env to form the full catalog name.
         - Returns "<full_catalog>.<schema>.<table_name>".
+        - Raises ValueError if any of those keys is missing.
     5. Properties:
         - config: Returns the raw parsed YAML configuration dictionary.
-        - full_table_name: Returns the computed fully qualified table name.
+        - full_table_name: Returns the fully qualified table name, computing it via
+          build_full_table_name() on first access and caching the interned string.
 """
 
+from __future__ import annotations
+
+import copy
+import os
+import sys
 import yaml
-from typing import Any, Dict
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+if TYPE_CHECKING:  # only used in annotations; importing pyspark is slow
+    from pyspark.sql import SparkSession
+
+try:  # libyaml-backed loader when PyYAML was built with it
+    from yaml import CSafeLoader as _YAMLLoader
+except ImportError:
+    from yaml import SafeLoader as _YAMLLoader
 
-from pyspark.sql import SparkSession
+
+@lru_cache(maxsize=32)
+def _load_yaml_cached(path: str, mtime_ns: int) -> Any:
+    """
+    Parses the YAML file at path; keyed on mtime so an edited file is re-read.
+    """
+    with open(path, "r") as f:
+        return yaml.load(f.read(), Loader=_YAMLLoader)
 
 
 def get_dbutils(spark: SparkSession) -> Any:
@@ -64,6 +88,8 @@ class YamlConfig:
     application, including constructing fully qualified table names based on
     a provided environment and YAML values.
     """
+    __slots__ = ("config_path", "env", "spark", "dbutils", "_config", "_full_table_name")
+
     def __init__(
         self,
         config_path: str,
@@ -86,7 +112,7 @@ class YamlConfig:
         self.dbutils = get_dbutils(spark)
         self._config: Dict[str, Any] = {}
         self.load_config()
-        self._full_table_name = self.build_full_table_name()
+        self._full_table_name: Optional[str] = None
 
     def load_config(self) -> None:
         """
@@ -95,8 +121,9 @@ class YamlConfig:
         :raises ValueError: If file cannot be opened or parsing fails.
         """
         try:
-            with open(self.config_path, "r") as f:
-                self._config = yaml.safe_load(f)
+            path = os.path.abspath(self.config_path)
+            # deep copy so callers mutating .config never touch the shared cached parse
+            self._config = copy.deepcopy(_load_yaml_cached(path, os.stat(path).st_mtime_ns))
         except (FileNotFoundError, yaml.YAMLError) as e:
             raise ValueError(
                 f"Error loading YAML configuration from {self.config_path}: {e}"
@@ -108,14 +135,24 @@ class YamlConfig:
         the specified environment.
 
         :return: Fully qualified table name, e.g., "dq_dev.monitoring.job_run_audit".
+        :raises ValueError: If app_config.target_table or any of its keys is missing or malformed.
         """
-        target = self._config.get("app_config", {}).get("target_table", {})
-        catalog = target.get("catalog", "").strip()
-        schema = target.get("schema", "").strip()
-        table = target.get("table_name", "").strip()
-
-        full_catalog = f"{catalog}{self.env}"
-        return f"{full_catalog}.{schema}.{table}"
+        try:
+            target = self._config["app_config"]["target_table"]
+            catalog, schema, table = (
+                target["catalog"].strip(),
+                target["schema"].strip(),
+                target["table_name"].strip(),
+            )
+        except KeyError as e:
+            raise ValueError(
+                f"Missing {e} under app_config.target_table in {self.config_path}"
+            ) from e
+        except (TypeError, AttributeError) as e:
+            raise ValueError(
+                f"Malformed app_config.target_table in {self.config_path}: {e}"
+            ) from e
+        return f"{catalog}{self.env}.{schema}.{table}"
 
     @property
     def config(self) -> Dict[str, Any]:
@@ -127,6 +164,8 @@ class YamlConfig:
     @property
     def full_table_name(self) -> str:
         """
-        Returns the fully qualified target table name computed during initialization.
+        Returns the fully qualified target table name, built on first access.
         """
+        if self._full_table_name is None:
+            self._full_table_name = sys.intern(self.build_full_table_name())
         return self._full_table_name
\ No newline at end of file